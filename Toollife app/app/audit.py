@@ -1,20 +1,70 @@
 import os
+import atexit
 import logging
+import queue
+import threading
+import time
 from .config import AUDIT_LOG_FILE, LOGS_DIR
-from .db import log_audit as db_log_audit
-
-# Ensure logs directory exists BEFORE configuring logging
-os.makedirs(LOGS_DIR, exist_ok=True)
-
-logging.basicConfig(
-    filename=AUDIT_LOG_FILE,
-    level=logging.INFO,
-    format="%(asctime)s - %(message)s"
-)
-
+from .db import log_audit_many
+
+# Ensure logs directory exists BEFORE configuring logging
+os.makedirs(LOGS_DIR, exist_ok=True)
+
+logging.basicConfig(
+    filename=AUDIT_LOG_FILE,
+    level=logging.INFO,
+    format="%(asctime)s - %(message)s"
+)
+
+# Audit entries are queued and written by a daemon thread so UI handlers
+# never wait on the log file or a DB commit; the writer batches whatever
+# arrives within a short window into one multi-row insert.
+_q: queue.Queue = queue.Queue()
+
+_BATCH_MAX = 100
+_BATCH_WINDOW = 0.2  # seconds
+
+
 def log_audit(user: str, action: str):
-    logging.info(f"User: {user} | Action: {action}")
+    _q.put((user, action))
+
+
+def _write(batch):
+    # a failing file handler or DB write must not kill the writer thread
     try:
-        db_log_audit(user, action)
+        for user, action in batch:
+            logging.info(f"User: {user} | Action: {action}")
+        log_audit_many(batch)
     except Exception:
         pass
+
+
+def _drain():
+    while True:
+        batch = [_q.get()]
+        deadline = time.monotonic() + _BATCH_WINDOW
+        while len(batch) < _BATCH_MAX:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_q.get(timeout=timeout))
+            except queue.Empty:
+                break
+        _write(batch)
+
+
+def _flush():
+    batch = []
+    while True:
+        try:
+            batch.append(_q.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write(batch)
+
+
+atexit.register(_flush)
+
+threading.Thread(target=_drain, name="audit-writer", daemon=True).start()
@@ -9,6 +9,25 @@ from typing import Any, Dict, Iterable, List, Optional
 from .config import DB_PATH
 
 
+# Read-side caches for the master-data lists that the UI re-fetches on
+# every tab switch/refresh. None means dirty; the writers below reset the
+# matching cache so the next list call re-queries.
+_tools_cache: Optional[List[Dict[str, Any]]] = None
+_parts_cache: Optional[List[Dict[str, Any]]] = None
+_scrap_cache: Optional[Dict[str, float]] = None
+_scrap_sorted_cache: Optional[List[tuple]] = None
+_machines_cache: Optional[List[Dict[str, Any]]] = None
+
+# Monotonic counter bumped on every tool-entry write; screens that show
+# entry data compare it against the value they loaded at and skip the
+# refetch/redraw when nothing has been written since.
+_entries_version = 0
+
+
+def entries_version() -> int:
+    return _entries_version
+
+
 @contextmanager
 def connect():
     conn = sqlite3.connect(DB_PATH)
@@ -252,6 +271,21 @@ def log_audit(username: str, action: str) -> None:
         )
 
 
+def log_audit_many(rows: Iterable[tuple]) -> None:
+    """Insert (username, action) pairs in one transaction.
+
+    Used by the background audit writer to batch queued entries.
+    """
+    rows = [((u or ""), (a or "")) for u, a in rows]
+    if not rows:
+        return
+    with connect() as conn:
+        conn.executemany(
+            "INSERT INTO audit_logs(username, action) VALUES(?, ?)",
+            rows,
+        )
+
+
 def get_meta(key: str) -> Optional[str]:
     with connect() as conn:
         row = conn.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
@@ -344,6 +378,8 @@ def list_lines() -> List[str]:
 
 
 def upsert_part(part_number: str, name: str = "", lines: Optional[List[str]] = None) -> None:
+    global _parts_cache
+    _parts_cache = None
     lines = lines or []
     with connect() as conn:
         # ensure lines
@@ -379,6 +415,8 @@ def upsert_part(part_number: str, name: str = "", lines: Optional[List[str]] = N
 
 
 def deactivate_part(part_number: str) -> None:
+    global _parts_cache
+    _parts_cache = None
     with connect() as conn:
         conn.execute(
             "UPDATE parts SET is_active=0, updated_at=datetime('now') WHERE part_number=?",
@@ -386,7 +424,22 @@ def deactivate_part(part_number: str) -> None:
         )
 
 
+def deactivate_parts(part_numbers: Iterable[str]) -> None:
+    part_numbers = [p for p in part_numbers if p]
+    if not part_numbers:
+        return
+    global _parts_cache
+    _parts_cache = None
+    with connect() as conn:
+        conn.executemany(
+            "UPDATE parts SET is_active=0, updated_at=datetime('now') WHERE part_number=?",
+            [(p,) for p in part_numbers],
+        )
+
+
 def upsert_tool(tool_num: str, name: str = "", unit_cost: float = 0.0) -> None:
+    global _tools_cache
+    _tools_cache = None
     with connect() as conn:
         conn.execute(
             """
@@ -409,6 +462,8 @@ def upsert_tool_inventory(
     stock_qty: int = 0,
     inserts_per_tool: int = 1,
 ) -> None:
+    global _tools_cache
+    _tools_cache = None
     with connect() as conn:
         conn.execute(
             """
@@ -425,6 +480,43 @@ def upsert_tool_inventory(
         )
 
 
+def upsert_tools_bulk(rows: Iterable[Dict[str, Any]]) -> int:
+    """Upsert many tool rows in one executemany/transaction.
+
+    Used by the CSV import path; returns the number of rows written.
+    """
+    params = [
+        (
+            str(r.get("tool_num", "")).strip(),
+            r.get("name", "") or "",
+            float(r.get("unit_cost", 0.0) or 0.0),
+            int(r.get("stock_qty", 0) or 0),
+            int(r.get("inserts_per_tool", 1) or 1),
+        )
+        for r in rows
+        if str(r.get("tool_num", "")).strip()
+    ]
+    if not params:
+        return 0
+    global _tools_cache
+    _tools_cache = None
+    with connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO tools(tool_num, name, unit_cost, stock_qty, inserts_per_tool, is_active)
+            VALUES(?, ?, ?, ?, ?, 1)
+            ON CONFLICT(tool_num) DO UPDATE SET
+              name=excluded.name,
+              unit_cost=excluded.unit_cost,
+              stock_qty=excluded.stock_qty,
+              inserts_per_tool=excluded.inserts_per_tool,
+              updated_at=datetime('now')
+            """,
+            params,
+        )
+    return len(params)
+
+
 def get_tool(tool_num: str) -> Optional[Dict[str, Any]]:
     with connect() as conn:
         row = conn.execute(
@@ -435,6 +527,8 @@ def get_tool(tool_num: str) -> Optional[Dict[str, Any]]:
 
 
 def update_tool_stock(tool_num: str, stock_qty: int) -> None:
+    global _tools_cache
+    _tools_cache = None
     with connect() as conn:
         conn.execute(
             "UPDATE tools SET stock_qty=?, updated_at=datetime('now') WHERE tool_num=?",
@@ -443,6 +537,8 @@ def update_tool_stock(tool_num: str, stock_qty: int) -> None:
 
 
 def deactivate_tool(tool_num: str) -> None:
+    global _tools_cache
+    _tools_cache = None
     with connect() as conn:
         conn.execute(
             "UPDATE tools SET is_active=0, updated_at=datetime('now') WHERE tool_num=?",
@@ -450,6 +546,19 @@ def deactivate_tool(tool_num: str) -> None:
         )
 
 
+def deactivate_tools(tool_nums: Iterable[str]) -> None:
+    tool_nums = [t for t in tool_nums if t]
+    if not tool_nums:
+        return
+    global _tools_cache
+    _tools_cache = None
+    with connect() as conn:
+        conn.executemany(
+            "UPDATE tools SET is_active=0, updated_at=datetime('now') WHERE tool_num=?",
+            [(t,) for t in tool_nums],
+        )
+
+
 def _tool_id(conn: sqlite3.Connection, tool_num: str) -> Optional[int]:
     row = conn.execute(
         "SELECT id FROM tools WHERE tool_num=?",
@@ -615,6 +724,11 @@ def list_tools_for_line(line: str, *, include_unassigned: bool = False) -> List[
 
 
 def set_scrap_cost(part_number: str, scrap_cost: float) -> None:
+    # May also insert a placeholder part, so the parts cache goes stale too.
+    global _scrap_cache, _scrap_sorted_cache, _parts_cache
+    _scrap_cache = None
+    _scrap_sorted_cache = None
+    _parts_cache = None
     with connect() as conn:
         row = conn.execute("SELECT id FROM parts WHERE part_number=?", (part_number,)).fetchone()
         if not row:
@@ -635,42 +749,72 @@ def set_scrap_cost(part_number: str, scrap_cost: float) -> None:
             """,
             (part_id, float(scrap_cost)),
         )
-def list_parts_with_lines():
+def clear_scrap_costs(part_numbers: Iterable[str]) -> None:
+    part_numbers = [p for p in part_numbers if p]
+    if not part_numbers:
+        return
+    global _scrap_cache, _scrap_sorted_cache
+    _scrap_cache = None
+    _scrap_sorted_cache = None
     with connect() as conn:
+        conn.executemany(
+            """
+            UPDATE part_costs SET scrap_cost=0, updated_at=datetime('now')
+            WHERE part_id=(SELECT id FROM parts WHERE part_number=?)
+            """,
+            [(p,) for p in part_numbers],
+        )
+
+
+def list_parts_with_lines(force: bool = False):
+    global _parts_cache
+    if not force and _parts_cache is not None:
+        return _parts_cache
+    with connect() as conn:
+        # One grouped join instead of a lines query per part.
         parts = conn.execute(
-            "SELECT id, part_number, name FROM parts WHERE is_active=1 ORDER BY part_number"
+            """
+            SELECT p.id, p.part_number, p.name,
+                   COALESCE(GROUP_CONCAT(l.name, ','), '') AS line_csv
+            FROM parts p
+            LEFT JOIN part_lines pl ON pl.part_id = p.id
+            LEFT JOIN lines l ON l.id = pl.line_id
+            WHERE p.is_active=1
+            GROUP BY p.id
+            ORDER BY p.part_number
+            """
         ).fetchall()
 
         out = []
         for p in parts:
-            lines = conn.execute(
-                """
-                SELECT l.name
-                FROM part_lines pl
-                JOIN lines l ON l.id = pl.line_id
-                WHERE pl.part_id=?
-                ORDER BY l.name
-                """,
-                (p["id"],),
-            ).fetchall()
+            lines = sorted(p["line_csv"].split(",")) if p["line_csv"] else []
             out.append({
                 "id": p["id"],
                 "part_number": p["part_number"],
                 "name": p["name"],
-                "lines": [r["name"] for r in lines],
+                "lines": lines,
+                "lines_display": ", ".join(lines),
             })
+        _parts_cache = out
         return out
 
 
-def list_tools_simple():
+def list_tools_simple(force: bool = False):
+    global _tools_cache
+    if not force and _tools_cache is not None:
+        return _tools_cache
     with connect() as conn:
         rows = conn.execute(
             "SELECT tool_num, name, unit_cost, stock_qty, inserts_per_tool FROM tools WHERE is_active=1 ORDER BY tool_num"
         ).fetchall()
-        return [dict(r) for r in rows]
+        _tools_cache = [dict(r) for r in rows]
+        return _tools_cache
 
 
-def list_machines() -> List[Dict[str, Any]]:
+def list_machines(force: bool = False) -> List[Dict[str, Any]]:
+    global _machines_cache
+    if not force and _machines_cache is not None:
+        return _machines_cache
     with connect() as conn:
         rows = conn.execute(
             """
@@ -679,7 +823,8 @@ def list_machines() -> List[Dict[str, Any]]:
             ORDER BY machine_number
             """
         ).fetchall()
-        return [dict(r) for r in rows]
+        _machines_cache = [dict(r) for r in rows]
+        return _machines_cache
 
 
 def upsert_machine(
@@ -691,6 +836,8 @@ def upsert_machine(
     spindle_connection: str = "",
     coolant_type: str = "",
 ) -> None:
+    global _machines_cache
+    _machines_cache = None
     with connect() as conn:
         conn.execute(
             """
@@ -779,6 +926,35 @@ def add_machine_program(machine_id: int, program_name: str, revision: int) -> No
         )
 
 
+def add_machine_program_revision(machine_id: int, program_name: str) -> int:
+    """Allocate the next revision and insert it in one transaction.
+
+    Folds next_machine_program_revision + add_machine_program into a
+    single connection, so concurrent callers cannot race between the MAX
+    read and the insert, and the caller pays one commit instead of two.
+    Returns the revision that was created.
+    """
+    with connect() as conn:
+        row = conn.execute(
+            """
+            SELECT MAX(revision) AS rev
+            FROM machine_programs
+            WHERE machine_id=? AND program_name=?
+            """,
+            (int(machine_id), program_name),
+        ).fetchone()
+        current = row["rev"] if row and row["rev"] is not None else 0
+        revision = int(current) + 1
+        conn.execute(
+            """
+            INSERT INTO machine_programs(machine_id, program_name, revision)
+            VALUES(?,?,?)
+            """,
+            (int(machine_id), program_name, revision),
+        )
+        return revision
+
+
 def next_machine_program_revision(machine_id: int, program_name: str) -> int:
     with connect() as conn:
         row = conn.execute(
@@ -832,7 +1008,67 @@ def next_part_file_revision(part_id: int, file_name: str) -> int:
         return int(current) + 1
 
 
-def get_scrap_costs_simple():
+def upsert_cnc_code_catalog_many(revision_id: int, rows: Iterable[tuple]) -> None:
+    """Upsert (code, code_type, count, sample_line) tuples in one transaction."""
+    with connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO cnc_code_catalog(revision_id, code, code_type, count, sample_line)
+            VALUES(?,?,?,?,?)
+            ON CONFLICT(revision_id, code) DO UPDATE SET
+              code_type=excluded.code_type,
+              count=excluded.count,
+              sample_line=excluded.sample_line
+            """,
+            [
+                (int(revision_id), code, code_type, int(count), int(sample_line))
+                for code, code_type, count, sample_line in rows
+            ],
+        )
+
+
+def add_cnc_findings_many(run_id: int, rows: Iterable[tuple]) -> None:
+    """Insert (severity, rule_id, line_numbers, message, impact_seconds) tuples in one transaction."""
+    with connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO cnc_findings(run_id, severity, rule_id, line_numbers, message, impact_seconds)
+            VALUES(?,?,?,?,?,?)
+            """,
+            [
+                (int(run_id), severity, rule_id, line_numbers, message, float(impact_seconds))
+                for severity, rule_id, line_numbers, message, impact_seconds in rows
+            ],
+        )
+
+
+def list_scrap_costs_sorted(force: bool = False) -> List[tuple]:
+    """Return (part_number, scrap_cost) tuples already ordered by part.
+
+    Lets the part_number index do the ordering so display code can insert
+    the rows as-is instead of sorting a dict's keys and re-looking each
+    one up.
+    """
+    global _scrap_sorted_cache
+    if not force and _scrap_sorted_cache is not None:
+        return _scrap_sorted_cache
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT p.part_number, pc.scrap_cost
+            FROM part_costs pc
+            JOIN parts p ON p.id = pc.part_id
+            ORDER BY p.part_number
+            """
+        ).fetchall()
+        _scrap_sorted_cache = [(r["part_number"], float(r["scrap_cost"])) for r in rows]
+        return _scrap_sorted_cache
+
+
+def get_scrap_costs_simple(force: bool = False):
+    global _scrap_cache
+    if not force and _scrap_cache is not None:
+        return _scrap_cache
     with connect() as conn:
         rows = conn.execute(
             """
@@ -842,7 +1078,8 @@ def get_scrap_costs_simple():
             ORDER BY p.part_number
             """
         ).fetchall()
-        return {r["part_number"]: float(r["scrap_cost"]) for r in rows}
+        _scrap_cache = {r["part_number"]: float(r["scrap_cost"]) for r in rows}
+        return _scrap_cache
 
 
 def list_downtime_codes(active_only: bool = True) -> List[Dict[str, Any]]:
@@ -1042,6 +1279,8 @@ def upsert_tool_entry(entry: Dict[str, Any]) -> None:
     if not entry.get("ID") and not entry.get("id"):
         raise ValueError("Entry must include ID")
     entry_id = str(entry.get("ID") or entry.get("id"))
+    global _entries_version
+    _entries_version += 1
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     record = {
         "id": entry_id,
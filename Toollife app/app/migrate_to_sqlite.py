@@ -12,7 +12,7 @@ from .db import (
     ensure_lines,
     upsert_tool_entry,
 )
-from .storage import load_json
+from .storage import load_json, split_csv
 from .config import DATA_DIR
 import os
 import pandas as pd
@@ -70,7 +70,7 @@ def run_migration() -> None:
             name = (item.get("name") or "").strip()
             lines = item.get("lines") or []
             if isinstance(lines, str):
-                lines = [x.strip() for x in lines.split(",") if x.strip()]
+                lines = split_csv(lines)
             if not isinstance(lines, list):
                 lines = []
             if pn:
@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from .db import init_db, seed_default_users, ensure_lines, upsert_part, upsert_tool, set_scrap_cost
-from .storage import load_json
+from .storage import load_json, split_csv
 from .config import (
     DEFAULT_USERS,
     PARTS_FILE,
@@ -20,7 +20,7 @@ def _as_list(x) -> List[Any]:
 
 def _coerce_lines(v):
     if isinstance(v, str):
-        return [s.strip() for s in v.split(",") if s.strip()]
+        return split_csv(v)
     if isinstance(v, list):
         return [str(s).strip() for s in v if str(s).strip()]
     return []
@@ -1,5 +1,6 @@
 # app/storage.py
 import os
+import re
 import json
 from datetime import datetime
 from typing import Any, Tuple, Optional
@@ -169,6 +170,21 @@ def save_df(df: pd.DataFrame, filename: str) -> None:
 # -----------------------------
 # Common converters
 # -----------------------------
+_SPLIT_CSV = re.compile(r"\s*,\s*")
+
+
+def split_csv(value: Any) -> list[str]:
+    """Split a comma-separated string into stripped, non-empty items.
+
+    One compiled-regex pass; the surrounding whitespace is consumed by the
+    pattern instead of a per-item strip().
+    """
+    raw = str(value or "").strip()
+    if not raw:
+        return []
+    return [s for s in _SPLIT_CSV.split(raw) if s]
+
+
 def safe_int(val: Any, default: int = 0) -> int:
     try:
         if val is None or (isinstance(val, float) and pd.isna(val)):
@@ -42,6 +42,7 @@ class AdminUI(tk.Frame):
     def __init__(self, parent, controller, show_header=True):
         super().__init__(parent, bg=controller.colors["bg"])
         self.controller = controller
+        bg = controller.colors["bg"]
 
         if show_header:
             HeaderFrame(self, controller).pack(fill="x")
@@ -50,11 +51,11 @@ class AdminUI(tk.Frame):
         nb.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Tabs
-        tab_users = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_actions = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_access = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_audit = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_cnc = tk.Frame(nb, bg=controller.colors["bg"])
+        tab_users = tk.Frame(nb, bg=bg)
+        tab_actions = tk.Frame(nb, bg=bg)
+        tab_access = tk.Frame(nb, bg=bg)
+        tab_audit = tk.Frame(nb, bg=bg)
+        tab_cnc = tk.Frame(nb, bg=bg)
 
         nb.add(tab_users, text="User Management")
         nb.add(tab_actions, text="Action Center")
@@ -80,14 +81,17 @@ class AdminUI(tk.Frame):
 
     # -------------------------
     def _build_user_management(self, parent):
-        top = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=10)
+        # bind the theme colors once for this construction-heavy method
+        colors = self.controller.colors
+        bg, fg = colors["bg"], colors["fg"]
+        top = tk.Frame(parent, bg=bg, padx=10, pady=10)
         top.pack(fill="x")
 
         tk.Label(
             top,
             text="User Management (Admin Only)",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
             font=("Arial", 16, "bold")
         ).pack(side="left")
 
@@ -98,8 +102,8 @@ class AdminUI(tk.Frame):
             text="User Details",
             padx=10,
             pady=10,
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         )
         form.pack(fill="x", padx=10, pady=(0, 10))
 
@@ -113,15 +117,15 @@ class AdminUI(tk.Frame):
         self._form_row(form, "Username", self.var_username)
         self._form_row(form, "Display Name", self.var_name)
 
-        r = tk.Frame(form, bg=self.controller.colors["bg"])
+        r = tk.Frame(form, bg=bg)
         r.pack(fill="x", pady=4)
         tk.Label(
             r,
             text="Role",
             width=14,
             anchor="w",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         ).pack(side="left")
         ttk.Combobox(r, textvariable=self.var_role, state="readonly", values=self.ROLE_OPTIONS, width=24).pack(side="left")
 
@@ -129,7 +133,7 @@ class AdminUI(tk.Frame):
         self._form_row(form, "Current Password", self.var_current_password, readonly=True)
         self._form_row(form, "New Password", self.var_new_password, show="*")
 
-        btns = tk.Frame(form, bg=self.controller.colors["bg"])
+        btns = tk.Frame(form, bg=bg)
         btns.pack(fill="x", pady=(10, 0))
         tk.Button(btns, text="Create User", command=self.create_user).pack(side="right")
         tk.Button(btns, text="Update User", command=self.update_user).pack(side="right", padx=(0, 8))
@@ -140,8 +144,8 @@ class AdminUI(tk.Frame):
             text="Existing Users",
             padx=10,
             pady=10,
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         )
         listbox_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
@@ -163,15 +167,17 @@ class AdminUI(tk.Frame):
         self.refresh_users()
 
     def _form_row(self, parent, label, var, show=None, readonly: bool = False):
-        r = tk.Frame(parent, bg=self.controller.colors["bg"])
+        colors = self.controller.colors
+        bg, fg = colors["bg"], colors["fg"]
+        r = tk.Frame(parent, bg=bg)
         r.pack(fill="x", pady=4)
         tk.Label(
             r,
             text=label,
             width=14,
             anchor="w",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         ).pack(side="left")
         e = tk.Entry(r, textvariable=var, show=show) if show else tk.Entry(r, textvariable=var)
         e.pack(side="left", fill="x", expand=True)
@@ -277,14 +283,16 @@ class AdminUI(tk.Frame):
 
     # -------------------------
     def _build_access_management(self, parent):
-        top = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=10)
+        colors = self.controller.colors
+        bg, fg = colors["bg"], colors["fg"]
+        top = tk.Frame(parent, bg=bg, padx=10, pady=10)
         top.pack(fill="x")
 
         tk.Label(
             top,
             text="Screen Access Overrides",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
             font=("Arial", 16, "bold"),
         ).pack(side="left")
 
@@ -295,8 +303,8 @@ class AdminUI(tk.Frame):
             text="Assign Screen Access",
             padx=10,
             pady=10,
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         )
         form.pack(fill="x", padx=10, pady=(0, 10))
 
@@ -304,15 +312,15 @@ class AdminUI(tk.Frame):
         self.access_screen = tk.StringVar(value="")
         self.access_level = tk.StringVar(value=self.SCREEN_LEVELS[0])
 
-        row_user = tk.Frame(form, bg=self.controller.colors["bg"])
+        row_user = tk.Frame(form, bg=bg)
         row_user.pack(fill="x", pady=4)
         tk.Label(
             row_user,
             text="User",
             width=14,
             anchor="w",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         ).pack(side="left")
         self.access_user_combo = ttk.Combobox(
             row_user,
@@ -323,15 +331,15 @@ class AdminUI(tk.Frame):
         )
         self.access_user_combo.pack(side="left")
 
-        row_screen = tk.Frame(form, bg=self.controller.colors["bg"])
+        row_screen = tk.Frame(form, bg=bg)
         row_screen.pack(fill="x", pady=4)
         tk.Label(
             row_screen,
             text="Screen",
             width=14,
             anchor="w",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         ).pack(side="left")
         self.screen_options = sorted(
             screen for screen in SCREEN_REGISTRY.keys()
@@ -346,15 +354,15 @@ class AdminUI(tk.Frame):
         )
         self.access_screen_combo.pack(side="left")
 
-        row_level = tk.Frame(form, bg=self.controller.colors["bg"])
+        row_level = tk.Frame(form, bg=bg)
         row_level.pack(fill="x", pady=4)
         tk.Label(
             row_level,
             text="Level",
             width=14,
             anchor="w",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         ).pack(side="left")
         self.access_level_combo = ttk.Combobox(
             row_level,
@@ -365,7 +373,7 @@ class AdminUI(tk.Frame):
         )
         self.access_level_combo.pack(side="left")
 
-        btns = tk.Frame(form, bg=self.controller.colors["bg"])
+        btns = tk.Frame(form, bg=bg)
         btns.pack(fill="x", pady=(10, 0))
         tk.Button(btns, text="Save Access", command=self.save_access).pack(side="right")
         tk.Button(btns, text="Remove Access", command=self.remove_access).pack(side="right", padx=(0, 8))
@@ -375,8 +383,8 @@ class AdminUI(tk.Frame):
             text="Current Overrides",
             padx=10,
             pady=10,
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
         )
         list_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
@@ -5,10 +5,15 @@ import hashlib
 import os
 import re
 import shutil
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
@@ -35,16 +40,16 @@ from .db import (
     add_cnc_program_revision,
     next_cnc_program_revision,
     get_cnc_program_revision,
-    upsert_cnc_code_catalog,
+    upsert_cnc_code_catalog_many,
     list_cnc_code_catalog,
     add_cnc_analysis_run,
     list_cnc_analysis_runs,
-    add_cnc_finding,
+    add_cnc_findings_many,
     list_cnc_findings,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     severity: str
     rule_id: str
@@ -53,11 +58,44 @@ class Finding:
     impact_seconds: float = 0.0
 
 
+# Compiled once at import; analyze_program runs these on every line of every
+# program, so per-line re.compile cache probes add up fast.
+_RE_GM_CODE = re.compile(r"\b([GM]\d+)\b")
+_RE_TOOL = re.compile(r"\bT(\d+)\b")
+_RE_XYZ = re.compile(r"([XYZ])([+-]?\d+(?:\.\d+)?)")
+
+# Token tables; once the G/M codes are extracted for a line, everything else
+# is a cheap set lookup rather than another regex probe.
+_SUPPORTED = frozenset({
+    "G0", "G00", "G1", "G01", "G2", "G02", "G3", "G03",
+    "G20", "G21", "G80", "G81", "G82", "G83", "G84", "G85", "G86", "G87", "G88", "G89",
+    "G90", "G91", "G94", "G95",
+    "M3", "M03", "M4", "M04", "M5", "M05", "M6", "M06", "M30",
+})
+_SPINDLE_ON = frozenset({"M3", "M03", "M4", "M04"})
+_SPINDLE_OFF = frozenset({"M5", "M05"})
+_CANNED = frozenset({"G81", "G82", "G83", "G84", "G85", "G86", "G87", "G88", "G89"})
+_MODAL = frozenset({"G0", "G00", "G1", "G01", "G2", "G02", "G3", "G03"})
+_CUT_MODES = frozenset({"G1", "G01", "G2", "G02", "G3", "G03"})
+
+
 class CNCAnalyzerUI(tk.Frame):
     def __init__(self, parent, controller, show_header=False):
         super().__init__(parent, bg=controller.colors["bg"])
         self.controller = controller
 
+        # Program/revision lookups keyed for O(1) access; combobox and
+        # selection handlers hit these instead of re-querying the DB.
+        self._programs_by_name: Dict[str, dict] = {}
+        self._revisions_by_program: Dict[int, List[dict]] = {}
+
+        # Import hashing/copying runs here so large files don't freeze Tk.
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Formatted line-number prefixes, grown on demand and shared by the
+        # library and analysis viewers so each index is formatted once.
+        self._line_prefixes: List[str] = []
+
         nb = ttk.Notebook(self)
         nb.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -89,6 +127,8 @@ class CNCAnalyzerUI(tk.Frame):
         top.pack(fill="x")
 
         tk.Button(top, text="Import Program", command=self.import_program).pack(side="left")
+        self.import_status = tk.Label(top, text="")
+        self.import_status.pack(side="left", padx=8)
 
         cols = ("program", "latest_rev", "imported_at")
         self.program_tree = ttk.Treeview(self.tab_library, columns=cols, show="headings", height=12)
@@ -115,10 +155,31 @@ class CNCAnalyzerUI(tk.Frame):
 
         self.refresh_program_list()
 
+    def _invalidate_program_cache(self):
+        self._programs_by_name.clear()
+        self._revisions_by_program.clear()
+
+    def _all_programs(self) -> List[dict]:
+        if not self._programs_by_name:
+            self._programs_by_name = {p["program_name"]: p for p in list_cnc_programs()}
+        return list(self._programs_by_name.values())
+
+    def _get_program(self, program_name: str):
+        if not self._programs_by_name:
+            self._all_programs()
+        return self._programs_by_name.get(program_name)
+
+    def _get_revisions(self, program_id: int) -> List[dict]:
+        revisions = self._revisions_by_program.get(program_id)
+        if revisions is None:
+            revisions = list_cnc_program_revisions(program_id)
+            self._revisions_by_program[program_id] = revisions
+        return revisions
+
     def refresh_program_list(self):
         for i in self.program_tree.get_children():
             self.program_tree.delete(i)
-        for prog in list_cnc_programs():
+        for prog in self._all_programs():
             latest = latest_cnc_program_revision(prog["id"])
             self.program_tree.insert("", "end", values=(
                 prog["program_name"],
@@ -133,25 +194,69 @@ class CNCAnalyzerUI(tk.Frame):
         )
         if not path:
             return
-        program_name = os.path.splitext(os.path.basename(path))[0]
-        with open(path, "rb") as f:
-            data = f.read()
-        file_hash = hashlib.sha256(data).hexdigest()
+        self.import_status.config(text="Importing...")
+        self._io_pool.submit(self._import_worker, path)
 
-        program_id = upsert_cnc_program(program_name)
-        latest = latest_cnc_program_revision(program_id)
-        if latest and latest.get("file_hash") == file_hash:
+    def _import_worker(self, path: str):
+        """Hash/copy/catalog off the main thread; DB helpers open a fresh
+        connection per call, so they are safe here. UI updates go back
+        through after()."""
+        program_name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            program_id = upsert_cnc_program(program_name)
+            latest = latest_cnc_program_revision(program_id)
+            if latest and self._matches_latest(latest, path):
+                self.after(0, self._finish_import, "duplicate", "")
+                return
+
+            with open(path, "rb") as f:
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+
+            revision = next_cnc_program_revision(program_id)
+            dest_dir = os.path.join(CNC_PROGRAMS_DIR, program_name, f"rev{revision}")
+            os.makedirs(dest_dir, exist_ok=True)
+            dest_path = os.path.join(dest_dir, os.path.basename(path))
+            shutil.copy2(path, dest_path)
+
+            revision_id = add_cnc_program_revision(program_id, revision, dest_path, file_hash)
+            self._update_code_catalog(revision_id, dest_path)
+        except Exception as exc:
+            self.after(0, self._finish_import, "error", str(exc))
+            return
+        self.after(0, self._finish_import, "ok", "")
+
+    def _matches_latest(self, latest: dict, path: str) -> bool:
+        """Staged duplicate check against the stored copy of the latest
+        revision: size, then first-4KiB hash, and only then the full
+        SHA-256. Most edits change the size or the header, so the full
+        read of large programs is usually skipped."""
+        stored_path = latest.get("file_path", "")
+        try:
+            if os.path.getsize(stored_path) != os.path.getsize(path):
+                return False
+            if _short_hash(stored_path) != _short_hash(path):
+                return False
+            with open(path, "rb") as f:
+                return latest.get("file_hash") == hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            # stored copy missing or unreadable: fall back to the hash
+            # recorded in the DB so a byte-identical re-import is still
+            # recognized as a duplicate
+            try:
+                with open(path, "rb") as f:
+                    return latest.get("file_hash") == hashlib.file_digest(f, "sha256").hexdigest()
+            except OSError:
+                return False
+
+    def _finish_import(self, status: str, detail: str):
+        self.import_status.config(text="")
+        if status == "duplicate":
             messagebox.showinfo("No Change", "Program matches latest revision. No new revision created.")
             return
-
-        revision = next_cnc_program_revision(program_id)
-        dest_dir = os.path.join(CNC_PROGRAMS_DIR, program_name, f"rev{revision}")
-        os.makedirs(dest_dir, exist_ok=True)
-        dest_path = os.path.join(dest_dir, os.path.basename(path))
-        shutil.copy2(path, dest_path)
-
-        revision_id = add_cnc_program_revision(program_id, revision, dest_path, file_hash)
-        self._update_code_catalog(revision_id, dest_path)
+        if status == "error":
+            messagebox.showerror("Import Failed", detail)
+            return
+        self._invalidate_program_cache()
         self.refresh_program_list()
 
     def load_program_selection(self, event=None):
@@ -159,11 +264,11 @@ class CNCAnalyzerUI(tk.Frame):
         if not sel:
             return
         program_name = self.program_tree.item(sel[0], "values")[0]
-        program = next((p for p in list_cnc_programs() if p["program_name"] == program_name), None)
+        program = self._get_program(program_name)
         if not program:
             return
         self.current_program_id = program["id"]
-        revisions = list_cnc_program_revisions(program["id"])
+        revisions = self._get_revisions(program["id"])
         self.revision_cb["values"] = [str(r["revision"]) for r in revisions]
         if revisions:
             self.revision_var.set(str(revisions[0]["revision"]))
@@ -175,7 +280,7 @@ class CNCAnalyzerUI(tk.Frame):
         rev = self.revision_var.get()
         if not rev:
             return
-        revisions = list_cnc_program_revisions(self.current_program_id)
+        revisions = self._get_revisions(self.current_program_id)
         match = next((r for r in revisions if str(r["revision"]) == rev), None)
         if match:
             self._load_revision(match["id"])
@@ -193,28 +298,66 @@ class CNCAnalyzerUI(tk.Frame):
         self._refresh_analysis_history()
 
     def _update_viewer(self, lines: List[str]):
-        self.program_view.delete("1.0", tk.END)
-        for idx, line in enumerate(lines, start=1):
-            self.program_view.insert(tk.END, f"{idx:>5}  {line}")
+        self._render_lines(self.program_view, lines)
+
+    def _prefixes_for(self, count: int) -> List[str]:
+        prefixes = self._line_prefixes
+        for i in range(len(prefixes), count):
+            prefixes.append(f"{i + 1:>5}  ")
+        return prefixes
+
+    def _render_lines(self, widget: tk.Text, lines: List[str], chunk: int = 5000):
+        """Fill a viewer with numbered lines using one insert call per chunk
+        instead of one Tk call per line."""
+        widget.delete("1.0", tk.END)
+        # tag this render so chunk callbacks left over from a superseded
+        # render stop instead of appending stale lines to the new content
+        gen = getattr(widget, "_render_gen", 0) + 1
+        widget._render_gen = gen
+        prefixes = self._prefixes_for(len(lines))
+        if len(lines) <= 20000:
+            widget.insert(tk.END, "\n".join(p + ln for p, ln in zip(prefixes, lines)))
+            return
+
+        def insert_chunk(start: int):
+            if widget._render_gen != gen:
+                return
+            end = min(start + chunk, len(lines))
+            widget.insert(
+                tk.END,
+                "\n".join(p + ln for p, ln in zip(prefixes[start:end], lines[start:end])) + "\n",
+            )
+            if end < len(lines):
+                self.after_idle(insert_chunk, end)
+
+        insert_chunk(0)
 
     def _read_program_lines(self, path: str) -> List[str]:
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                return [ln.rstrip("\n") for ln in f.readlines()]
+            return list(_read_lines_cached(path, os.path.getmtime(path)))
         except Exception:
             return []
 
-    def _update_code_catalog(self, revision_id: int, path: str):
-        lines = self._read_program_lines(path)
-        code_counts = {}
-        sample_lines = {}
-        for idx, line in enumerate(lines, start=1):
-            for code in re.findall(r"\b([GM]\d+)\b", line.upper()):
-                code_counts[code] = code_counts.get(code, 0) + 1
-                sample_lines.setdefault(code, idx)
-        for code, count in code_counts.items():
-            code_type = "G" if code.startswith("G") else "M"
-            upsert_cnc_code_catalog(revision_id, code, code_type, count, sample_lines.get(code, 0))
+    def _update_code_catalog(self, revision_id: int, path: str, lines: List[str] | None = None) -> List[dict]:
+        if lines is None:
+            lines = self._read_program_lines(path)
+        _, code_counts, sample_lines = _tokenize_program(lines)
+        entries = [
+            {
+                "code": code,
+                "code_type": code[0],
+                "count": count,
+                "sample_line": sample_lines.get(code, 0),
+            }
+            for code, count in code_counts.items()
+        ]
+        if entries:
+            upsert_cnc_code_catalog_many(revision_id, [
+                (e["code"], e["code_type"], e["count"], e["sample_line"]) for e in entries
+            ])
+        # Same shape as list_cnc_code_catalog rows so callers can skip the
+        # follow-up query.
+        return entries
 
     def _refresh_code_panel(self, revision_id: int):
         self.code_panel.delete(0, "end")
@@ -230,8 +373,7 @@ class CNCAnalyzerUI(tk.Frame):
         if not codes and self.current_lines:
             rev = get_cnc_program_revision(revision_id)
             if rev:
-                self._update_code_catalog(revision_id, rev["file_path"])
-                codes = list_cnc_code_catalog(revision_id)
+                codes = self._update_code_catalog(revision_id, rev["file_path"], lines=self.current_lines)
         for row in codes:
             self.observed_codes.insert(
                 "end",
@@ -292,7 +434,7 @@ class CNCAnalyzerUI(tk.Frame):
         self._refresh_program_dropdowns()
 
     def _refresh_program_dropdowns(self):
-        programs = list_cnc_programs()
+        programs = self._all_programs()
         self.analysis_prog_cb["values"] = [p["program_name"] for p in programs]
         if programs:
             self.analysis_prog_var.set(programs[0]["program_name"])
@@ -300,10 +442,10 @@ class CNCAnalyzerUI(tk.Frame):
 
     def _analysis_program_changed(self, event=None):
         program_name = self.analysis_prog_var.get()
-        program = next((p for p in list_cnc_programs() if p["program_name"] == program_name), None)
+        program = self._get_program(program_name)
         if not program:
             return
-        revisions = list_cnc_program_revisions(program["id"])
+        revisions = self._get_revisions(program["id"])
         self.analysis_rev_cb["values"] = [str(r["revision"]) for r in revisions]
         if revisions:
             self.analysis_rev_var.set(str(revisions[0]["revision"]))
@@ -311,11 +453,11 @@ class CNCAnalyzerUI(tk.Frame):
 
     def _analysis_revision_changed(self, event=None):
         program_name = self.analysis_prog_var.get()
-        program = next((p for p in list_cnc_programs() if p["program_name"] == program_name), None)
+        program = self._get_program(program_name)
         if not program:
             return
         rev = self.analysis_rev_var.get()
-        revisions = list_cnc_program_revisions(program["id"])
+        revisions = self._get_revisions(program["id"])
         match = next((r for r in revisions if str(r["revision"]) == rev), None)
         if match:
             self.current_revision_id = match["id"]
@@ -326,9 +468,7 @@ class CNCAnalyzerUI(tk.Frame):
             self._refresh_analysis_history()
 
     def _update_analysis_view(self):
-        self.analysis_view.delete("1.0", tk.END)
-        for idx, line in enumerate(self.current_lines, start=1):
-            self.analysis_view.insert(tk.END, f"{idx:>5}  {line}")
+        self._render_lines(self.analysis_view, self.current_lines)
 
     def run_analysis(self):
         if not self.current_revision_id:
@@ -349,15 +489,17 @@ class CNCAnalyzerUI(tk.Frame):
             efficiency,
             cycle_time,
         )
-        for f in findings:
-            add_cnc_finding(
-                run_id,
-                f.severity,
-                f.rule_id,
-                ",".join(str(x) for x in f.line_numbers),
-                f.message,
-                f.impact_seconds,
-            )
+        if findings:
+            add_cnc_findings_many(run_id, [
+                (
+                    f.severity,
+                    f.rule_id,
+                    ",".join(str(x) for x in f.line_numbers),
+                    f.message,
+                    f.impact_seconds,
+                )
+                for f in findings
+            ])
 
         self.current_findings = findings
         self.current_tools = tools
@@ -475,9 +617,10 @@ class CNCAnalyzerUI(tk.Frame):
             messagebox.showerror("Missing Dependency", "openpyxl is not available.")
             return
         path = os.path.join(CNC_EXPORTS_DIR, f"cnc_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Summary"
+        # Write-only mode streams rows straight into the xlsx zip instead of
+        # keeping a cell object per value in memory.
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Summary")
         ws.append(["Efficiency Score", self.current_efficiency])
         ws.append(["Cycle Time (sec)", self.current_cycle_time])
         breakdown = getattr(self, "current_breakdown", {})
@@ -521,122 +664,227 @@ class CNCAnalyzerUI(tk.Frame):
             y -= 14
             c.drawString(40, y, f"Average Move (mm): {breakdown.get('avg_move_mm', 0.0):.2f}")
             y -= 20
+        # One text object per page instead of a drawString (and BT/ET block)
+        # per row keeps the content stream small and the loop cheap.
+        t = c.beginText(40, y)
+        t.setFont("Helvetica", 10)
+
+        def page_break(t):
+            c.drawText(t)
+            c.showPage()
+            t = c.beginText(40, height - 40)
+            t.setFont("Helvetica", 10)
+            return t
+
         for f in self.current_findings:
-            c.drawString(40, y, f"{f.severity} {f.rule_id}: {f.message}")
-            y -= 14
-            if y < 60:
-                c.showPage()
-                y = height - 40
-        y -= 10
-        c.drawString(40, y, "Tool Summary")
-        y -= 16
+            t.textLine(f"{f.severity} {f.rule_id}: {f.message}")
+            if t.getY() < 60:
+                t = page_break(t)
+        t.textLine("")
+        t.textLine("Tool Summary")
         for tool, info in self.current_tools.items():
-            c.drawString(40, y, f"T{tool} | Calls: {int(info.get('calls', 0))} | Cut Time: {info.get('cut_time', 0.0):.1f}")
-            y -= 14
-            if y < 60:
-                c.showPage()
-                y = height - 40
+            t.textLine(f"T{tool} | Calls: {int(info.get('calls', 0))} | Cut Time: {info.get('cut_time', 0.0):.1f}")
+            if t.getY() < 60:
+                t = page_break(t)
+        c.drawText(t)
         c.save()
         self.export_status.config(text=f"Saved PDF: {path}")
 
 
+def _short_hash(path: str, length: int = 4096) -> str:
+    """SHA-256 of the first `length` bytes only; cheap prefilter for
+    whole-file comparisons."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _read_lines_cached(path: str, mtime: float) -> Tuple[str, ...]:
+    """Read and split a program file once per (path, mtime).
+
+    One C-level pass; splitlines strips newline variants without
+    materializing a second list the way readlines + rstrip did. Keying on
+    mtime invalidates the entry naturally when the file is rewritten.
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return tuple(f.read().splitlines())
+
+
+def _ffill(values: "np.ndarray") -> "np.ndarray":
+    """Forward-fill NaNs with the last seen value (index 0 must be set)."""
+    idx = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(idx, out=idx)
+    return values[idx]
+
+
+def _extract_geometry(lines: List[str]) -> Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Pull per-line XYZ targets into arrays and vectorize the move distances.
+
+    Returns (uppercased lines, move flags, per-move distances, raw Z values).
+    Arrays are indexed by 1-based line number; slot 0 holds the machine
+    origin so the filled positions diff cleanly.
+    """
+    n = len(lines)
+    uppers = [raw.upper() for raw in lines]
+    xs = np.full(n + 1, np.nan)
+    ys = np.full(n + 1, np.nan)
+    zs = np.full(n + 1, np.nan)
+    xs[0] = ys[0] = zs[0] = 0.0
+    has_move = np.zeros(n + 1, dtype=bool)
+
+    arrays = {"X": xs, "Y": ys, "Z": zs}
+    finditer = _RE_XYZ.finditer
+    for i, line in enumerate(uppers, start=1):
+        for m in finditer(line):
+            arr = arrays[m.group(1)]
+            if arr[i] != arr[i]:  # first word per axis wins, as before
+                arr[i] = float(m.group(2))
+                has_move[i] = True
+
+    z_raw = zs.copy()
+    xs = _ffill(xs)
+    ys = _ffill(ys)
+    zs = _ffill(zs)
+    dists = np.sqrt(np.diff(xs) ** 2 + np.diff(ys) ** 2 + np.diff(zs) ** 2)
+    return uppers, has_move, dists, z_raw
+
+
+def _tokenize_program(lines: List[str]) -> Tuple[List[List[str]], Dict[str, int], Dict[str, int]]:
+    """Extract G/M tokens from every line in one pass.
+
+    Returns (codes_per_line, code_counts, sample_lines) so callers can reuse
+    the tokenization instead of re-scanning the program.
+    """
+    codes_per_line: List[List[str]] = []
+    code_counts: Counter = Counter()
+    sample_lines: Dict[str, int] = {}
+    for idx, raw in enumerate(lines, start=1):
+        codes = _RE_GM_CODE.findall(raw.upper())
+        codes_per_line.append(codes)
+        code_counts.update(codes)
+        for code in codes:
+            sample_lines.setdefault(code, idx)
+    return codes_per_line, code_counts, sample_lines
+
+
 def analyze_program(lines: List[str]) -> Dict[str, object]:
+    return _scan(*_extract_geometry(lines))
+
+
+def _scan(uppers: List[str], has_move: "np.ndarray", dists: "np.ndarray", z_raw: "np.ndarray") -> Dict[str, object]:
+    """Sequential state-machine kernel over the tokenized/vectorized program.
+
+    Split out from analyze_program so the hot loop works purely on the
+    pre-extracted inputs, with module lookups bound to locals up front.
+    """
+    find_codes = _RE_GM_CODE.findall
+    search_tool = _RE_TOOL.search
+    supported = _SUPPORTED
+    spindle_on_codes = _SPINDLE_ON
+    spindle_off_codes = _SPINDLE_OFF
+    canned_codes = _CANNED
+    modal_codes = _MODAL
+    cut_modes = _CUT_MODES
+
     units = "mm"
     feed_mode = "G94"
     current_tool = None
     spindle_on = False
     last_modal = None
-    tool_calls = {}
-    tool_sections = {}
+    tool_calls: Counter = Counter()
+    tool_sections = defaultdict(list)
     moves = []
-    cut_time = {}
+    cut_time = defaultdict(float)
     findings: List[Finding] = []
-    g_codes_seen = set()
-    m_codes_seen = set()
     canned_active = False
     last_spindle_line = None
     retract_cycles = 0
     last_z = None
     unsupported_codes = set()
+    unknown_code_lines: List[int] = []
+    modal_spam_lines: List[int] = []
     feed_mode_flagged = False
 
-    position = {"X": 0.0, "Y": 0.0, "Z": 0.0}
-    move_lengths = []
+    move_total = 0.0
+    move_count = 0
 
-    for idx, raw in enumerate(lines, start=1):
-        line = raw.upper()
-        codes = re.findall(r"\b([GM]\d+)\b", line)
+    for idx, line in enumerate(uppers, start=1):
+        codes = find_codes(line)
+        modal = None
         for code in codes:
-            if code.startswith("G"):
-                g_codes_seen.add(code)
-            if code.startswith("M"):
-                m_codes_seen.add(code)
-
-        if "G20" in line:
-            units = "inch"
-        if "G21" in line:
-            units = "mm"
-        if "G95" in line:
-            feed_mode = "G95"
-        if "G94" in line:
-            feed_mode = "G94"
-
-        if re.search(r"\bM0?3\b", line) or re.search(r"\bM0?4\b", line):
-            spindle_on = True
-            last_spindle_line = idx
-        if re.search(r"\bM0?5\b", line):
-            spindle_on = False
-
-        tool_match = re.search(r"\bT(\d+)\b", line)
+            if code not in supported and code not in unsupported_codes:
+                unsupported_codes.add(code)
+                unknown_code_lines.append(idx)
+            if code in spindle_on_codes:
+                spindle_on = True
+                last_spindle_line = idx
+            elif code in spindle_off_codes:
+                spindle_on = False
+            elif code == "G20":
+                units = "inch"
+            elif code == "G21":
+                units = "mm"
+            elif code == "G95":
+                feed_mode = "G95"
+            elif code == "G94":
+                feed_mode = "G94"
+            elif code == "G80":
+                canned_active = False
+            elif code in canned_codes:
+                canned_active = True
+            elif code in modal_codes and modal is None:
+                modal = code
+
+        tool_match = search_tool(line)
         if tool_match:
             tool = tool_match.group(1)
             current_tool = tool
-            tool_calls[tool] = tool_calls.get(tool, 0) + 1
-            tool_sections.setdefault(tool, []).append(idx)
+            tool_calls[tool] += 1
+            tool_sections[tool].append(idx)
 
-        if "G80" in line:
-            canned_active = False
-        if re.search(r"\bG8\d\b", line) and "G80" not in line:
-            canned_active = True
-
-        modal_match = re.search(r"\bG0?([0123])\b", line)
-        if modal_match:
-            modal = modal_match.group(0)
+        if modal:
             if modal == last_modal:
-                findings.append(Finding("INFO", "MODAL_SPAM", [idx], f"Redundant modal {modal} repeated."))
+                modal_spam_lines.append(idx)
             last_modal = modal
 
-        coords = {}
-        for axis in ("X", "Y", "Z"):
-            match = re.search(rf"{axis}([+-]?\d+(\.\d+)?)", line)
-            if match:
-                coords[axis] = float(match.group(1))
-
-        if coords:
-            target = position.copy()
-            target.update(coords)
-            dist = ((target["X"] - position["X"]) ** 2 + (target["Y"] - position["Y"]) ** 2 + (target["Z"] - position["Z"]) ** 2) ** 0.5
+        if has_move[idx]:
+            dist = float(dists[idx - 1])
             if units == "inch":
                 dist *= 25.4
-            move_lengths.append(dist)
+            move_total += dist
+            move_count += 1
             moves.append((idx, dist, line))
-            if last_z is not None and "Z" in coords:
-                if coords["Z"] > last_z:
-                    retract_cycles += 0.5
-                if coords["Z"] < last_z:
-                    retract_cycles += 0.5
-            last_z = coords.get("Z", last_z)
-            position = target
-            if modal_match and modal_match.group(0) in ("G1", "G01", "G2", "G02", "G3", "G03"):
+            z = z_raw[idx]
+            if z == z:  # Z was specified on this line (not NaN)
+                if last_z is not None:
+                    if z > last_z:
+                        retract_cycles += 0.5
+                    if z < last_z:
+                        retract_cycles += 0.5
+                last_z = float(z)
+            if modal in cut_modes:
                 if not spindle_on:
                     findings.append(Finding("CRITICAL", "SPINDLE_MISSING", [idx], "Cutting move without spindle start."))
                 if current_tool:
-                    cut_time[current_tool] = cut_time.get(current_tool, 0.0) + dist
+                    cut_time[current_tool] += dist
 
         if feed_mode == "G95" and not feed_mode_flagged:
             findings.append(Finding("INFO", "FEED_UNSUPPORTED", [idx], "G95 feed mode detected."))
             feed_mode_flagged = True
 
+    if unknown_code_lines:
+        findings.append(
+            Finding(
+                "INFO",
+                "UNKNOWN_CODE",
+                unknown_code_lines,
+                f"Unknown/Unhandled codes encountered: {', '.join(sorted(unsupported_codes))}.",
+            )
+        )
+    if modal_spam_lines:
+        findings.append(
+            Finding("INFO", "MODAL_SPAM", modal_spam_lines, f"Redundant modal codes repeated on {len(modal_spam_lines)} lines.")
+        )
     if canned_active:
         findings.append(Finding("CRITICAL", "CANNED_MISSING_G80", [], "Canned cycle used without G80 cancel."))
     if retract_cycles >= 6:
@@ -646,8 +894,8 @@ def analyze_program(lines: List[str]) -> Dict[str, object]:
         if len(sections) > 1:
             findings.append(Finding("WARN", "TOOL_RECALL", sections, f"Tool {tool} recalled in multiple sections."))
 
-    if move_lengths:
-        avg_move = sum(move_lengths) / len(move_lengths)
+    if move_count:
+        avg_move = move_total / move_count
         if avg_move < 0.5:
             findings.append(Finding("WARN", "TINY_SEGMENTS", [], "Average move length is very small."))
 
@@ -655,20 +903,6 @@ def analyze_program(lines: List[str]) -> Dict[str, object]:
         if dist > 200 and "G1" in line:
             findings.append(Finding("INFO", "AIR_CUT", [idx], "Long cutting feed move may be air-cutting.", 1.0))
 
-    supported_codes = {
-        "G0", "G00", "G1", "G01", "G2", "G02", "G3", "G03",
-        "G20", "G21", "G80", "G81", "G82", "G83", "G84", "G85", "G86", "G87", "G88", "G89",
-        "G90", "G91", "G94", "G95",
-        "M3", "M03", "M4", "M04", "M5", "M05", "M6", "M06", "M30",
-    }
-    for idx, raw in enumerate(lines, start=1):
-        for code in re.findall(r"\b([GM]\d+)\b", raw.upper()):
-            if code not in supported_codes and code not in unsupported_codes:
-                unsupported_codes.add(code)
-                findings.append(
-                    Finding("INFO", "UNKNOWN_CODE", [idx], f"Unknown/Unhandled code encountered: {code}.")
-                )
-
     tool_summary = {}
     for tool, count in tool_calls.items():
         tool_summary[tool] = {"calls": count, "cut_time": cut_time.get(tool, 0.0)}
@@ -685,7 +919,7 @@ def analyze_program(lines: List[str]) -> Dict[str, object]:
         "tools": tool_summary,
         "breakdown": {
             "cut_distance_mm": float(sum(cut_time.values())),
-            "move_distance_mm": float(sum(move_lengths)),
-            "avg_move_mm": float(sum(move_lengths) / len(move_lengths)) if move_lengths else 0.0,
+            "move_distance_mm": move_total,
+            "avg_move_mm": move_total / move_count if move_count else 0.0,
         },
     }
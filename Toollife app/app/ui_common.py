@@ -35,6 +35,55 @@ class FilePicker(tk.Frame):
     def get(self):
         return self.cb.get()
 
+class VirtualTree:
+    """Lazy row pager for a ttk.Treeview.
+
+    Keeps the full row list on the Python side and only materializes a
+    page of items at a time, topping up when the user scrolls near the
+    bottom. Opening a tab with thousands of rows then costs one page of
+    Tcl inserts instead of the whole table. Values tuples whose first
+    element is a non-empty key are inserted with that key as the iid.
+    """
+
+    def __init__(self, tree, page=500):
+        self.tree = tree
+        self.page = page
+        self.rows = []
+        self._shown = 0
+        self._loaded_hash = None
+        # chain any scrollbar hookup the tree already had
+        self._chained = tree["yscrollcommand"] or None
+        tree.configure(yscrollcommand=self._on_scroll)
+
+    def load(self, rows):
+        # cheapest refresh is no refresh: skip the delete + reinsert
+        # when the row set is identical to what is already displayed
+        h = hash(tuple(rows))
+        if h == self._loaded_hash:
+            return
+        self._loaded_hash = h
+        self.rows = rows
+        self._shown = 0
+        self.tree.delete(*self.tree.get_children())
+        self._extend()
+
+    def _extend(self):
+        insert = self.tree.insert
+        end = min(self._shown + self.page, len(self.rows))
+        for r in self.rows[self._shown:end]:
+            if r[0]:
+                insert("", "end", iid=r[0], values=r)
+            else:
+                insert("", "end", values=r)
+        self._shown = end
+
+    def _on_scroll(self, first, last):
+        if self._chained:
+            self.tree.tk.eval(f"{self._chained} {first} {last}")
+        if float(last) > 0.9 and self._shown < len(self.rows):
+            self._extend()
+
+
 class DataTable(tk.Frame):
     def __init__(self, parent, columns):
         super().__init__(parent)
@@ -54,10 +103,13 @@ class DataTable(tk.Frame):
         self.tree.pack(fill="both", expand=True)
 
     def load(self, df):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for _, row in df.iterrows():
-            self.tree.insert("", "end", values=[row.get(c, "") for c in self.columns])
+        self.tree.delete(*self.tree.get_children())
+        # reindex once to the display columns (missing ones become ""),
+        # then iterate plain tuples instead of boxing a Series per row
+        view = df.reindex(columns=self.columns, fill_value="")
+        insert = self.tree.insert
+        for row in view.itertuples(index=False, name=None):
+            insert("", "end", values=row)
 
     def selected_id(self):
         sel = self.tree.selection()
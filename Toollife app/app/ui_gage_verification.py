@@ -18,6 +18,7 @@ class GageVerificationUI(tk.Frame):
     def __init__(self, parent, controller, show_header=True):
         super().__init__(parent, bg=controller.colors["bg"])
         self.controller = controller
+        bg, fg = controller.colors["bg"], controller.colors["fg"]
 
         if show_header:
             HeaderFrame(self, controller).pack(fill="x")
@@ -30,24 +31,24 @@ class GageVerificationUI(tk.Frame):
         self.gage_ids = sorted([g.get("gage_id") for g in self.gages_store.get("gages", []) if g.get("gage_id")])
 
         # Top title row
-        top = tk.Frame(self, bg=controller.colors["bg"], padx=10, pady=10)
+        top = tk.Frame(self, bg=bg, padx=10, pady=10)
         top.pack(fill="x")
 
         tk.Label(
             top,
             text="Gage Verification (Super/Admin)",
-            bg=controller.colors["bg"],
-            fg=controller.colors["fg"],
+            bg=bg,
+            fg=fg,
             font=("Arial", 16, "bold")
         ).pack(side="left")
 
         tk.Button(top, text="Refresh", command=self.reload).pack(side="right")
 
         # Selector row
-        sel = tk.Frame(self, bg=controller.colors["bg"], padx=10, pady=6)
+        sel = tk.Frame(self, bg=bg, padx=10, pady=6)
         sel.pack(fill="x")
 
-        tk.Label(sel, text="Select Gage:", bg=controller.colors["bg"], fg=controller.colors["fg"]).pack(side="left")
+        tk.Label(sel, text="Select Gage:", bg=bg, fg=fg).pack(side="left")
 
         self.sel_gage = ttk.Combobox(sel, values=self.gage_ids, state="readonly", width=18)
         self.sel_gage.pack(side="left", padx=8)
@@ -57,27 +58,27 @@ class GageVerificationUI(tk.Frame):
         tk.Button(sel, text="Load Checklist", command=self.load_checklist).pack(side="left", padx=(8, 0))
 
         # Notes row
-        notes = tk.Frame(self, bg=controller.colors["bg"], padx=10, pady=6)
+        notes = tk.Frame(self, bg=bg, padx=10, pady=6)
         notes.pack(fill="x")
 
-        tk.Label(notes, text="Notes:", bg=controller.colors["bg"], fg=controller.colors["fg"]).pack(side="left")
+        tk.Label(notes, text="Notes:", bg=bg, fg=fg).pack(side="left")
         self.notes_var = tk.StringVar(value="")
         tk.Entry(notes, textvariable=self.notes_var).pack(side="left", fill="x", expand=True, padx=8)
 
         # Checklist container (scrollable)
-        self.canvas = tk.Canvas(self, bg=controller.colors["bg"], highlightthickness=0)
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
         self.canvas.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
 
         self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.vsb.pack(side="right", fill="y", pady=10)
 
         self.canvas.configure(yscrollcommand=self.vsb.set)
-        self.check_body = tk.Frame(self.canvas, bg=controller.colors["bg"])
+        self.check_body = tk.Frame(self.canvas, bg=bg)
         self.canvas.create_window((0, 0), window=self.check_body, anchor="nw")
         self.check_body.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
 
         # Bottom actions
-        bottom = tk.Frame(self, bg=controller.colors["bg"], padx=10, pady=10)
+        bottom = tk.Frame(self, bg=bg, padx=10, pady=10)
         bottom.pack(fill="x")
 
         tk.Button(bottom, text="Submit Verification", command=self.submit).pack(side="right")
@@ -119,6 +120,9 @@ class GageVerificationUI(tk.Frame):
             messagebox.showwarning("Missing gage", f"Gage {gid} not found in gages.json.")
             return
 
+        colors = self.controller.colors
+        bg, fg = colors["bg"], colors["fg"]
+
         gtype = str(g.get("type", "Other") or "Other").strip()
         by_type = (self.q_store.get("by_type") or {})
         questions = by_type.get(gtype) or by_type.get("Other") or []
@@ -130,34 +134,34 @@ class GageVerificationUI(tk.Frame):
         self.loaded_for_gid = gid
 
         # Header
-        head = tk.Frame(self.check_body, bg=self.controller.colors["bg"])
+        head = tk.Frame(self.check_body, bg=bg)
         head.pack(fill="x", pady=(0, 8))
 
         tk.Label(
             head,
             text=f"{gid} — {g.get('name','')} ({gtype})",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
+            bg=bg,
+            fg=fg,
             font=("Arial", 13, "bold")
         ).pack(anchor="w")
 
         tk.Label(
             head,
             text="Set each check to Pass / Fail / NA then Submit.",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"]
+            bg=bg,
+            fg=fg
         ).pack(anchor="w", pady=(2, 0))
 
         # Questions
         for q in questions:
-            row = tk.Frame(self.check_body, bg=self.controller.colors["bg"], padx=6, pady=4)
+            row = tk.Frame(self.check_body, bg=bg, padx=6, pady=4)
             row.pack(fill="x")
 
             tk.Label(
                 row,
                 text="• " + str(q),
-                bg=self.controller.colors["bg"],
-                fg=self.controller.colors["fg"],
+                bg=bg,
+                fg=fg,
                 wraplength=780,
                 justify="left"
             ).pack(side="left", fill="x", expand=True)
@@ -171,8 +175,8 @@ class GageVerificationUI(tk.Frame):
             tk.Label(
                 self.check_body,
                 text="No checklist questions found for this gage type. Add questions in gage_verification_questions.json.",
-                bg=self.controller.colors["bg"],
-                fg=self.controller.colors["fg"]
+                bg=bg,
+                fg=fg
             ).pack(anchor="w", pady=10)
 
     # -------------------------
@@ -6,11 +6,15 @@ import shutil
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
+import pandas as pd
+
 from .storage import safe_float, safe_int
+from .ui_common import VirtualTree
 from .db import (
     list_tools_simple,
     upsert_tool_inventory,
-    deactivate_tool,
+    upsert_tools_bulk,
+    deactivate_tools,
     list_tools_for_line,
     list_lines,
     get_tool_lines,
@@ -21,9 +25,11 @@ from .db import (
     set_tool_parts,
     list_parts_with_lines,
     upsert_part,
-    deactivate_part,
+    deactivate_parts,
     set_scrap_cost,
+    clear_scrap_costs,
     get_scrap_costs_simple,
+    list_scrap_costs_sorted,
     list_downtime_codes,
     upsert_downtime_code,
     deactivate_downtime_code,
@@ -33,6 +39,16 @@ from .audit import log_audit
 
 
 
+def _read_vars(*tk_vars):
+    """Read several Tk variables in one tight pass.
+
+    Save handlers read 3-5 StringVars back to back; batching the .get()
+    calls keeps the Python->Tcl round-trips together and gives the
+    handlers a single unpack instead of interleaved widget reads.
+    """
+    return [v.get() for v in tk_vars]
+
+
 class MasterDataUI(tk.Frame):
     """
     Super/Admin Master Data:
@@ -46,14 +62,17 @@ class MasterDataUI(tk.Frame):
         super().__init__(parent, bg=controller.colors["bg"])
         self.controller = controller
         self.readonly = not controller.can_edit_screen("Master Data")
+        # resolve the theme colors once instead of per widget
+        self._bg = controller.colors["bg"]
+        self._fg = controller.colors["fg"]
 
         nb = ttk.Notebook(self)
         nb.pack(fill="both", expand=True, padx=10, pady=10)
 
-        tab_tools = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_parts = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_scrap = tk.Frame(nb, bg=controller.colors["bg"])
-        tab_downtime = tk.Frame(nb, bg=controller.colors["bg"])
+        tab_tools = tk.Frame(nb, bg=self._bg)
+        tab_parts = tk.Frame(nb, bg=self._bg)
+        tab_scrap = tk.Frame(nb, bg=self._bg)
+        tab_downtime = tk.Frame(nb, bg=self._bg)
 
         nb.add(tab_tools, text="Tool Pricing")
         nb.add(tab_parts, text="Parts & Lines")
@@ -65,27 +84,27 @@ class MasterDataUI(tk.Frame):
         self._build_scrap(tab_scrap)
         self._build_downtime(tab_downtime)
 
+    def _lbl(self, parent, text, **kw):
+        """Themed tk.Label factory; closes over the cached bg/fg."""
+        return tk.Label(parent, text=text, bg=self._bg, fg=self._fg, **kw)
+
     # -------------------- TOOL PRICING --------------------
     def _build_tool_pricing(self, parent):
-        top = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=10)
+        top = tk.Frame(parent, bg=self._bg, padx=10, pady=10)
         top.pack(fill="x")
 
-        tk.Label(
-            top,
-            text="Tool Pricing",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
-            font=("Arial", 14, "bold"),
-        ).pack(side="left")
+        self._lbl(top, "Tool Pricing", font=("Arial", 14, "bold")).pack(side="left")
 
-        tk.Button(top, text="Refresh", command=self.refresh_tools).pack(side="right")
+        tk.Button(top, text="Refresh", command=lambda: self.refresh_tools(force=True)).pack(side="right")
+        self.tool_import_btn = tk.Button(top, text="Import CSV", command=self.import_tools_csv)
+        self.tool_import_btn.pack(side="right", padx=8)
         self.tool_add_btn = tk.Button(top, text="Add Tool", command=lambda: self._open_tool_editor())
         self.tool_add_btn.pack(side="right", padx=8)
 
-        filter_frame = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=6)
+        filter_frame = tk.Frame(parent, bg=self._bg, padx=10, pady=6)
         filter_frame.pack(fill="x")
 
-        tk.Label(filter_frame, text="Line Filter:", bg=self.controller.colors["bg"], fg=self.controller.colors["fg"]).pack(side="left")
+        self._lbl(filter_frame, "Line Filter:").pack(side="left")
         self.tool_line_filter = tk.StringVar(value="All")
         line_options = ["All"] + (list_lines() or [])
         self.tool_line_combo = ttk.Combobox(
@@ -114,6 +133,7 @@ class MasterDataUI(tk.Frame):
             else:
                 self.tool_tree.column(c, width=220)
         self.tool_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        self.tool_pager = VirtualTree(self.tool_tree)
         self.tool_tree.bind("<Double-1>", lambda e: self._open_tool_editor(self._selected_tool()))
 
         self.refresh_tools()
@@ -124,33 +144,68 @@ class MasterDataUI(tk.Frame):
             return
         self.tool_add_btn.configure(state="disabled")
         self.tool_del_btn.configure(state="disabled")
+        self.tool_import_btn.configure(state="disabled")
 
-    def refresh_tools(self):
-        for i in self.tool_tree.get_children():
-            self.tool_tree.delete(i)
+    def import_tools_csv(self):
+        """Bulk-load tool pricing from a CSV with the tool_tree columns
+        (tool_num, name, unit_cost, stock_qty, inserts_per_tool)."""
+        if self.readonly:
+            return
+        path = filedialog.askopenfilename(
+            title="Import Tool Pricing CSV",
+            filetypes=[("CSV Files", "*.csv")],
+        )
+        if not path:
+            return
+        try:
+            df = pd.read_csv(path)
+        except Exception as exc:
+            messagebox.showerror("Import Failed", str(exc))
+            return
+
+        rows = []
+        for rec in df.to_dict("records"):
+            name = rec.get("name", "")
+            rows.append({
+                "tool_num": "" if pd.isna(rec.get("tool_num", "")) else str(rec.get("tool_num", "")).strip(),
+                "name": "" if pd.isna(name) else str(name),
+                "unit_cost": safe_float(rec.get("unit_cost", 0.0), 0.0),
+                "stock_qty": safe_int(rec.get("stock_qty", 0), 0),
+                "inserts_per_tool": safe_int(rec.get("inserts_per_tool", 1), 1),
+            })
+        count = upsert_tools_bulk(rows)
+        if not count:
+            messagebox.showwarning("Import", "No rows with a tool_num found in the file.")
+            return
+        log_audit(self.controller.user, f"Imported {count} tool(s) from CSV")
+        messagebox.showinfo("Import Complete", f"Imported {count} tool(s).")
+        self.refresh_tools()
 
+    def refresh_tools(self, force: bool = False):
         line_filter = self.tool_line_filter.get() if hasattr(self, "tool_line_filter") else "All"
-        tool_rows = list_tools_simple()
+        tool_rows = list_tools_simple(force=force)
         if line_filter and line_filter != "All":
             allowed = set(list_tools_for_line(line_filter, include_unassigned=False))
             tool_rows = [t for t in tool_rows if t.get("tool_num") in allowed]
 
-        for tool in tool_rows:
-            tool_num = tool.get("tool_num", "")
-            self.tool_tree.insert("", "end", values=(
-                tool_num,
-                tool.get("name", ""),
-                tool.get("unit_cost", 0.0),
-                tool.get("stock_qty", 0),
-                ", ".join(get_tool_lines(tool_num)),
-                ", ".join(get_tool_parts(tool_num)),
-            ))
+        rows = [
+            (
+                t.get("tool_num", ""),
+                t.get("name", ""),
+                t.get("unit_cost", 0.0),
+                t.get("stock_qty", 0),
+                ", ".join(get_tool_lines(t.get("tool_num", ""))),
+                ", ".join(get_tool_parts(t.get("tool_num", ""))),
+            )
+            for t in tool_rows
+        ]
+        self.tool_pager.load(rows)
 
     def _selected_tool(self):
         sel = self.tool_tree.selection()
         if not sel:
             return ""
-        return self.tool_tree.item(sel[0], "values")[0]
+        return sel[0]
 
     def _open_tool_editor(self, tool_num: str = ""):
         if self.readonly:
@@ -236,15 +291,16 @@ class MasterDataUI(tk.Frame):
         tk.Button(form, text="Recalculate Cost", command=recalc_cost).grid(row=6, column=0, pady=8, sticky="w")
 
         def save():
-            tnum = tool_num_var.get().strip()
+            tnum, name, cost_s, stock_s = _read_vars(tool_num_var, tool_name_var, tool_cost_var, tool_stock_var)
+            tnum = tnum.strip()
             if not tnum:
                 messagebox.showerror("Error", "Tool # is required.")
                 return
             upsert_tool_inventory(
                 tool_num=tnum,
-                name=tool_name_var.get().strip(),
-                unit_cost=safe_float(tool_cost_var.get(), 0.0),
-                stock_qty=safe_int(tool_stock_var.get(), 0),
+                name=name.strip(),
+                unit_cost=safe_float(cost_s, 0.0),
+                stock_qty=safe_int(stock_s, 0),
                 inserts_per_tool=1,
             )
             set_tool_lines(tnum, [ln for ln, var in line_vars.items() if var.get()])
@@ -258,16 +314,14 @@ class MasterDataUI(tk.Frame):
         recalc_cost()
 
     def delete_selected_tool(self):
-        sel = self.tool_tree.selection()
-        if not sel:
-            return
-        tool = self.tool_tree.item(sel[0], "values")[0]
-        if not tool:
+        tools = [t for t in self.tool_tree.selection() if t]
+        if not tools:
             return
-        if not messagebox.askyesno("Confirm", f"Delete tool '{tool}'?"):
+        prompt = f"Delete tool '{tools[0]}'?" if len(tools) == 1 else f"Delete {len(tools)} selected tools?"
+        if not messagebox.askyesno("Confirm", prompt):
             return
-        deactivate_tool(tool)
-        log_audit(self.controller.user, f"Deactivated tool {tool}")
+        deactivate_tools(tools)
+        log_audit(self.controller.user, f"Deactivated {len(tools)} tool(s): {', '.join(tools)}")
         self.refresh_tools()
 
     def save_tools(self):
@@ -323,18 +377,12 @@ class MasterDataUI(tk.Frame):
 
     # -------------------- PARTS & LINES --------------------
     def _build_parts(self, parent):
-        top = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=10)
+        top = tk.Frame(parent, bg=self._bg, padx=10, pady=10)
         top.pack(fill="x")
 
-        tk.Label(
-            top,
-            text="Parts & Line Assignment",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
-            font=("Arial", 14, "bold"),
-        ).pack(side="left")
+        self._lbl(top, "Parts & Line Assignment", font=("Arial", 14, "bold")).pack(side="left")
 
-        tk.Button(top, text="Refresh", command=self.refresh_parts).pack(side="right")
+        tk.Button(top, text="Refresh", command=lambda: self.refresh_parts(force=True)).pack(side="right")
         self.part_add_btn = tk.Button(top, text="Add Part", command=lambda: self._open_part_editor())
         self.part_add_btn.pack(side="right", padx=8)
 
@@ -344,6 +392,7 @@ class MasterDataUI(tk.Frame):
             self.part_tree.heading(c, text=c.upper())
             self.part_tree.column(c, width=260 if c != "lines" else 420)
         self.part_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        self.part_pager = VirtualTree(self.part_tree)
         self.part_tree.bind("<Double-1>", lambda e: self._open_part_editor(self._selected_part()))
 
         self.part_del_btn = tk.Button(parent, text="Delete Selected", command=self.delete_selected_part)
@@ -358,22 +407,22 @@ class MasterDataUI(tk.Frame):
         self.part_add_btn.configure(state="disabled")
         self.part_del_btn.configure(state="disabled")
 
-    def refresh_parts(self):
-        for i in self.part_tree.get_children():
-            self.part_tree.delete(i)
-
-        for p in list_parts_with_lines():
-            self.part_tree.insert("", "end", values=(
+    def refresh_parts(self, force: bool = False):
+        rows = [
+            (
                 p.get("part_number", ""),
                 p.get("name", ""),
-                ", ".join(p.get("lines", []) or []),
-            ))
+                p.get("lines_display", ""),
+            )
+            for p in list_parts_with_lines(force=force)
+        ]
+        self.part_pager.load(rows)
 
     def _selected_part(self):
         sel = self.part_tree.selection()
         if not sel:
             return ""
-        return self.part_tree.item(sel[0], "values")[0]
+        return sel[0]
 
     def _open_part_editor(self, part_number: str = ""):
         if self.readonly:
@@ -413,11 +462,12 @@ class MasterDataUI(tk.Frame):
             tk.Checkbutton(line_frame, text=line, variable=var).grid(row=0, column=idx, sticky="w", padx=6)
 
         def save():
-            pn = part_var.get().strip()
+            pn, name = _read_vars(part_var, name_var)
+            pn = pn.strip()
             if not pn:
                 messagebox.showerror("Error", "Part # is required.")
                 return
-            name = name_var.get().strip()
+            name = name.strip()
             lines = [ln for ln, var in line_vars.items() if var.get()]
             upsert_part(pn, name=name, lines=lines)
             log_audit(self.controller.user, f"Updated part {pn} lines/pricing")
@@ -427,33 +477,25 @@ class MasterDataUI(tk.Frame):
         tk.Button(form, text="Save Part", command=save, bg="#28a745", fg="white").grid(row=3, column=1, sticky="e", pady=10)
 
     def delete_selected_part(self):
-        sel = self.part_tree.selection()
-        if not sel:
+        parts = [p for p in self.part_tree.selection() if p]
+        if not parts:
             return
-        pn = self.part_tree.item(sel[0], "values")[0]
-        if not pn:
-            return
-        if not messagebox.askyesno("Confirm", f"Delete part '{pn}'?"):
+        prompt = f"Delete part '{parts[0]}'?" if len(parts) == 1 else f"Delete {len(parts)} selected parts?"
+        if not messagebox.askyesno("Confirm", prompt):
             return
 
-        deactivate_part(pn)
-        log_audit(self.controller.user, f"Deactivated part {pn}")
+        deactivate_parts(parts)
+        log_audit(self.controller.user, f"Deactivated {len(parts)} part(s): {', '.join(parts)}")
         self.refresh_parts()
 
     # -------------------- SCRAP PRICING --------------------
     def _build_scrap(self, parent):
-        top = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=10)
+        top = tk.Frame(parent, bg=self._bg, padx=10, pady=10)
         top.pack(fill="x")
 
-        tk.Label(
-            top,
-            text="Scrap Pricing (by Part)",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
-            font=("Arial", 14, "bold"),
-        ).pack(side="left")
+        self._lbl(top, "Scrap Pricing (by Part)", font=("Arial", 14, "bold")).pack(side="left")
 
-        tk.Button(top, text="Refresh", command=self.refresh_scrap).pack(side="right")
+        tk.Button(top, text="Refresh", command=lambda: self.refresh_scrap(force=True)).pack(side="right")
         self.scrap_add_btn = tk.Button(top, text="Add Scrap Cost", command=lambda: self._open_scrap_editor())
         self.scrap_add_btn.pack(side="right", padx=8)
 
@@ -463,6 +505,7 @@ class MasterDataUI(tk.Frame):
             self.scrap_tree.heading(c, text=c.upper())
             self.scrap_tree.column(c, width=260)
         self.scrap_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        self.scrap_pager = VirtualTree(self.scrap_tree)
         self.scrap_tree.bind("<Double-1>", lambda e: self._open_scrap_editor(self._selected_scrap_part()))
 
         self.scrap_del_btn = tk.Button(parent, text="Delete Selected", command=self.delete_selected_scrap)
@@ -477,18 +520,14 @@ class MasterDataUI(tk.Frame):
         self.scrap_add_btn.configure(state="disabled")
         self.scrap_del_btn.configure(state="disabled")
 
-    def refresh_scrap(self):
-        for i in self.scrap_tree.get_children():
-            self.scrap_tree.delete(i)
+    def refresh_scrap(self, force: bool = False):
+        self.scrap_pager.load(list_scrap_costs_sorted(force=force))
 
-        m = get_scrap_costs_simple()
-        for pn in sorted(m.keys()):
-            self.scrap_tree.insert("", "end", values=(pn, m[pn]))
     def _selected_scrap_part(self):
         sel = self.scrap_tree.selection()
         if not sel:
             return ""
-        return self.scrap_tree.item(sel[0], "values")[0]
+        return sel[0]
 
     def _open_scrap_editor(self, part_number: str = ""):
         if self.readonly:
@@ -515,11 +554,12 @@ class MasterDataUI(tk.Frame):
         tk.Entry(form, textvariable=cost_var, width=12).grid(row=1, column=1, sticky="w", pady=(8, 0))
 
         def save():
-            pn = pn_var.get().strip()
+            pn, cost_s = _read_vars(pn_var, cost_var)
+            pn = pn.strip()
             if not pn:
                 messagebox.showerror("Error", "Part # is required.")
                 return
-            cost = safe_float(cost_var.get(), 0.0)
+            cost = safe_float(cost_s, 0.0)
             set_scrap_cost(pn, cost)
             log_audit(self.controller.user, f"Set scrap cost for {pn} to {cost}")
             self.refresh_scrap()
@@ -528,30 +568,26 @@ class MasterDataUI(tk.Frame):
         tk.Button(form, text="Save Scrap Cost", command=save, bg="#28a745", fg="white").grid(row=2, column=1, sticky="e", pady=12)
 
     def delete_selected_scrap(self):
-        sel = self.scrap_tree.selection()
-        if not sel:
-            return
-        pn = self.scrap_tree.item(sel[0], "values")[0]
-        if not pn:
+        parts = [p for p in self.scrap_tree.selection() if p]
+        if not parts:
             return
-        if not messagebox.askyesno("Confirm", f"Delete scrap price for '{pn}'?"):
+        prompt = (
+            f"Delete scrap price for '{parts[0]}'?"
+            if len(parts) == 1
+            else f"Delete scrap prices for {len(parts)} selected parts?"
+        )
+        if not messagebox.askyesno("Confirm", prompt):
             return
-        set_scrap_cost(pn, 0.0)
-        log_audit(self.controller.user, f"Cleared scrap cost for {pn}")
+        clear_scrap_costs(parts)
+        log_audit(self.controller.user, f"Cleared scrap cost for {len(parts)} part(s): {', '.join(parts)}")
         self.refresh_scrap()
 
     # -------------------- DOWNTIME CODES --------------------
     def _build_downtime(self, parent):
-        top = tk.Frame(parent, bg=self.controller.colors["bg"], padx=10, pady=10)
+        top = tk.Frame(parent, bg=self._bg, padx=10, pady=10)
         top.pack(fill="x")
 
-        tk.Label(
-            top,
-            text="Downtime Codes",
-            bg=self.controller.colors["bg"],
-            fg=self.controller.colors["fg"],
-            font=("Arial", 14, "bold"),
-        ).pack(side="left")
+        self._lbl(top, "Downtime Codes", font=("Arial", 14, "bold")).pack(side="left")
 
         tk.Button(top, text="Refresh", command=self.refresh_downtime).pack(side="right")
         self.downtime_add_btn = tk.Button(top, text="Add Code", command=lambda: self._open_downtime_editor())
@@ -563,6 +599,7 @@ class MasterDataUI(tk.Frame):
             self.downtime_tree.heading(c, text=c.upper())
             self.downtime_tree.column(c, width=220)
         self.downtime_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        self.downtime_pager = VirtualTree(self.downtime_tree)
         self.downtime_tree.bind("<Double-1>", lambda e: self._open_downtime_editor(self._selected_downtime()))
 
         self.downtime_del_btn = tk.Button(parent, text="Deactivate Selected", command=self.delete_selected_downtime)
@@ -574,15 +611,15 @@ class MasterDataUI(tk.Frame):
             self.downtime_del_btn.configure(state="disabled")
 
     def refresh_downtime(self):
-        for i in self.downtime_tree.get_children():
-            self.downtime_tree.delete(i)
-
-        for row in list_downtime_codes(active_only=False):
-            self.downtime_tree.insert("", "end", values=(
+        rows = [
+            (
                 row.get("code", ""),
                 row.get("description", ""),
                 "Yes" if row.get("is_active", 1) else "No",
-            ))
+            )
+            for row in list_downtime_codes(active_only=False)
+        ]
+        self.downtime_pager.load(rows)
 
     def _selected_downtime(self):
         sel = self.downtime_tree.selection()
@@ -615,11 +652,12 @@ class MasterDataUI(tk.Frame):
         tk.Entry(form, textvariable=desc_var, width=30).grid(row=1, column=1, sticky="w", pady=(8, 0))
 
         def save():
-            code_val = code_var.get().strip()
+            code_val, desc = _read_vars(code_var, desc_var)
+            code_val = code_val.strip()
             if not code_val:
                 messagebox.showerror("Error", "Code is required.")
                 return
-            upsert_downtime_code(code_val, desc_var.get().strip())
+            upsert_downtime_code(code_val, desc.strip())
             log_audit(self.controller.user, f"Updated downtime code {code_val}")
             self.refresh_downtime()
             top.destroy()
@@ -1,12 +1,14 @@
 import os
 import shutil
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, simpledialog, filedialog
 import pandas as pd
 
 from .ui_common import HeaderFrame, FilePicker, DataTable
 from .storage import get_df, save_df, safe_int, safe_float
 from .db import (
+    entries_version,
     list_tools_simple,
     upsert_tool_inventory,
     get_tool,
@@ -16,8 +18,7 @@ from .db import (
     list_machine_maintenance,
     add_machine_maintenance,
     list_machine_programs,
-    add_machine_program,
-    next_machine_program_revision,
+    add_machine_program_revision,
 )
 from .config import MACHINES_DIR
 from .audit import log_audit
@@ -42,9 +43,19 @@ class TopUI(tk.Frame):
         nb.add(self.tab_tools, text="Manage Tools ($/Stock)")
         nb.add(self.tab_machines, text="Machines")
 
-        self._build_data_tab()
-        self._build_tools_tab()
-        self._build_machines_tab()
+        # build tabs lazily on first visit so startup only pays for the
+        # data tab; the tools/machines queries wait until they're shown
+        self.nb = nb
+        self._builders = [self._build_data_tab, self._build_tools_tab, self._build_machines_tab]
+        self._built = [False, False, False]
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        i = self.nb.index("current")
+        if not self._built[i]:
+            self._built[i] = True
+            self._builders[i]()
 
     # ---------- Data Tab ----------
     def _build_data_tab(self):
@@ -70,9 +81,19 @@ class TopUI(tk.Frame):
             self.override_btn.configure(state="disabled")
 
     def load_data(self, filename):
+        # (month, write counter) gate: re-entering the tab or hitting
+        # Reload when no entry has been written since the last load skips
+        # the refetch and the full table rebuild.
+        key = (filename, entries_version())
+        if key == getattr(self, "_loaded_key", None):
+            return
         df, _ = get_df(filename)
         self._df = df
         self._filename = filename
+        self._loaded_key = key
+        # ID -> row position, so override_edit can find a row without
+        # string-casting and scanning the whole ID column per click.
+        self._id_index = dict(zip(df["ID"].astype(str).values, range(len(df))))
         self.table.load(df)
 
     def override_edit(self):
@@ -82,11 +103,15 @@ class TopUI(tk.Frame):
             return
 
         df, filename = get_df(self._filename)
-        idx = df.index[df["ID"].astype(str) == str(sel_id)]
-        if len(idx) == 0:
+        i = self._id_index.get(str(sel_id))
+        if i is None or i >= len(df) or str(df.at[i, "ID"]) != str(sel_id):
+            # entries written since load_data shift row positions; rebuild
+            # the map from the frame we just fetched before giving up
+            self._id_index = dict(zip(df["ID"].astype(str).values, range(len(df))))
+            i = self._id_index.get(str(sel_id))
+        if i is None:
             messagebox.showerror("Not found", "Row not found in file.")
             return
-        i = idx[0]
 
         top = tk.Toplevel(self)
         top.title(f"Override Edit - ID {sel_id}")
@@ -100,19 +125,24 @@ class TopUI(tk.Frame):
             ("Defect_Reason", "Defect Reason"),
         ]
         entries = {}
+        row = df.loc[i]
         for col, label in fields:
             tk.Label(top, text=label).pack(anchor="w", padx=10, pady=(10, 0))
             e = tk.Entry(top)
-            e.insert(0, str(df.at[i, col] if pd.notna(df.at[i, col]) else ""))
+            val = row[col]
+            e.insert(0, "" if pd.isna(val) else str(val))
             e.pack(fill="x", padx=10)
             entries[col] = e
 
         def save():
-            df.at[i, "Downtime_Mins"] = safe_int(entries["Downtime_Mins"].get(), 0)
-            df.at[i, "Cost"] = safe_float(entries["Cost"].get(), 0.0)
-            df.at[i, "Serial_Numbers"] = entries["Serial_Numbers"].get().strip()
-            df.at[i, "Reason"] = entries["Reason"].get().strip()
-            df.at[i, "Defect_Reason"] = entries["Defect_Reason"].get().strip()
+            edits = {
+                "Downtime_Mins": safe_int(entries["Downtime_Mins"].get(), 0),
+                "Cost": safe_float(entries["Cost"].get(), 0.0),
+                "Serial_Numbers": entries["Serial_Numbers"].get().strip(),
+                "Reason": entries["Reason"].get().strip(),
+                "Defect_Reason": entries["Defect_Reason"].get().strip(),
+            }
+            df.loc[i, list(edits)] = list(edits.values())
 
             save_df(df, filename)
             top.destroy()
@@ -160,14 +190,19 @@ class TopUI(tk.Frame):
         self.refresh_tool_list()
 
     def refresh_tool_list(self):
-        self.tool_list.delete(0, "end")
         self._tools = list_tools_simple()
-        for tool in self._tools:
-            t = tool.get("tool_num", "")
-            self.tool_list.insert(
-                "end",
-                f"{t} | Stock: {tool.get('stock_qty', 0)} | ${tool.get('unit_cost', 0)}"
-            )
+        items = [
+            f"{tool.get('tool_num', '')} | Stock: {tool.get('stock_qty', 0)} | ${tool.get('unit_cost', 0)}"
+            for tool in self._tools
+        ]
+        # skip the rebuild when the list hasn't changed
+        h = hash(tuple(items))
+        if h == getattr(self, "_tool_list_hash", None):
+            return
+        self._tool_list_hash = h
+        self.tool_list.delete(0, "end")
+        if items:
+            self.tool_list.insert("end", *items)
 
     def load_tool_details(self, event=None):
         sel = self.tool_list.curselection()
@@ -235,10 +270,15 @@ class TopUI(tk.Frame):
         self.refresh_machine_list()
 
     def refresh_machine_list(self):
-        self.machine_list.delete(0, "end")
         self._machines = list_machines()
-        for m in self._machines:
-            self.machine_list.insert("end", f"{m.get('machine_number', '')} | Line {m.get('line', '')}")
+        items = [f"{m.get('machine_number', '')} | Line {m.get('line', '')}" for m in self._machines]
+        h = hash(tuple(items))
+        if h == getattr(self, "_machine_list_hash", None):
+            return
+        self._machine_list_hash = h
+        self.machine_list.delete(0, "end")
+        if items:
+            self.machine_list.insert("end", *items)
 
     def _selected_machine_number(self):
         sel = self.machine_list.curselection()
@@ -400,8 +440,7 @@ class TopUI(tk.Frame):
             )
             if not file_paths:
                 return
-            revision = next_machine_program_revision(mrow["id"], program_name)
-            add_machine_program(mrow["id"], program_name, revision)
+            revision = add_machine_program_revision(mrow["id"], program_name)
 
             dest_dir = os.path.join(
                 MACHINES_DIR,
@@ -411,8 +450,13 @@ class TopUI(tk.Frame):
                 f"rev{revision}",
             )
             os.makedirs(dest_dir, exist_ok=True)
-            for path in file_paths:
-                shutil.copy2(path, os.path.join(dest_dir, os.path.basename(path)))
+            # copies are I/O bound; overlap them instead of copying one
+            # file at a time
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as ex:
+                list(ex.map(
+                    lambda p: shutil.copy2(p, os.path.join(dest_dir, os.path.basename(p))),
+                    file_paths,
+                ))
 
             refresh_programs()
 